@@ -3,5 +3,7 @@ from nicknames._csvfile import NameTriplet as NameTriplet
 from nicknames._csvfile import RelationshipType as RelationshipType
 from nicknames._csvfile import name_triplets as name_triplets
 from nicknames._csvfile import with_names_csv_path as with_names_csv_path
+from nicknames._fullname import ParsedName as ParsedName
+from nicknames._fullname import parse_full_name as parse_full_name
 from nicknames._nicknamer import NickNamer as NickNamer
 from nicknames._version import __version__ as __version__
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import string
+from typing import NamedTuple, Tuple
+
+# Everything is compiled once at import time so that parse_full_name() is just
+# a str.translate() and a str.split() per record, not a chain of regexes.
+
+# Periods become ". " so "J.R." -> "j. r." and "Dr.Robert" -> "dr. robert",
+# keeping the period on the token so that "gen." can be told apart from "gen".
+# Commas are kept so we can detect "Last, First" order.
+# Hyphens and apostrophes are kept so "Mary-Jane" and "O'Brien" stay one token.
+# All other punctuation, including common unicode quotes and dashes,
+# becomes whitespace.
+_KEEP = {",", "-", "'", "."}
+_TRANSLATION_TABLE = str.maketrans(
+    {
+        **{c: " " for c in string.punctuation if c not in _KEEP},
+        # quotes and dashes
+        **{c: " " for c in "\u201c\u201d\u201e\u00ab\u00bb\u2018"},
+        **{c: " " for c in "\u2013\u2014\u2015\u2212"},
+        ".": ". ",
+        "\u2019": "'",  # right single quote, as in "O\u2019Brien"
+        "\u2010": "-",  # hyphen
+        "\u2011": "-",  # non-breaking hyphen
+        "\uff0c": ",",  # full-width comma
+    }
+)
+
+# Nicknames given inline, as in 'Robert "Bob" Smith' or "Robert (Bob) Smith",
+# are dropped before tokenizing. Straight single quotes are left alone since
+# they are also apostrophes.
+_QUOTE_PAIRS = {
+    "(": ")",
+    "[": "]",
+    '"': '"',
+    "\u201c": "\u201d",
+    "\u2018": "\u2019",
+    "\u00ab": "\u00bb",
+}
+_QUOTE_OPENERS = frozenset(_QUOTE_PAIRS)
+
+# Titles are matched with their period, if any.
+# These are titles with or without a period:
+_TITLES = [
+    "capt",
+    "dr",
+    "lt",
+    "miss",
+    "mr",
+    "mrs",
+    "ms",
+    "mx",
+    "prof",
+    "rev",
+    "sgt",
+    "sir",
+]
+# These are also given names, so are only titles with a period, eg "Gen.":
+_ABBREVIATED_TITLES = [
+    "col",
+    "fr",
+    "gen",
+    "hon",
+]
+TITLES = frozenset(
+    [
+        *_TITLES,
+        *(t + "." for t in _TITLES),
+        *(t + "." for t in _ABBREVIATED_TITLES),
+    ]
+)
+# Suffixes are matched after periods are removed.
+SUFFIXES = frozenset(
+    [
+        "cpa",
+        "dds",
+        "esq",
+        "ii",
+        "iii",
+        "iv",
+        "jr",
+        "md",
+        "phd",
+        "sr",
+    ]
+)
+# Dotted degrees such as "Ph.D." are split into several tokens by the period.
+_SPLIT_SUFFIXES = frozenset(
+    [
+        ("c", "p", "a"),
+        ("d", "d", "s"),
+        ("m", "d"),
+        ("ph", "d"),
+    ]
+)
+# These look the same as initials, so are only suffixes when they follow
+# a surname, as in "Robert E. Lee V".
+_NUMERAL_SUFFIXES = frozenset(["i", "v"])
+
+
+class ParsedName(NamedTuple):
+    """A full name split into its parts, with titles and suffixes removed.
+
+    All parts are lowercase and have no leading or trailing whitespace.
+
+    eg "Dr. Robert J. Smith Jr." and "SMITH, ROBERT J" both become
+    ParsedName(given='robert', middle=('j',), surname='smith')
+    """
+
+    given: str
+    # typing.Tuple so that get_type_hints() works on python 3.8
+    middle: Tuple[str, ...]
+    surname: str
+
+
+def parse_full_name(name: str) -> ParsedName | None:
+    """Split a full name string into given name, middle names, and surname.
+
+    Titles (eg "Dr.") and suffixes (eg "Jr.") are dropped.
+    Titles that are also given names, such as "Gen", need a period to be
+    dropped. Nicknames in quotes or parentheses, as in 'Robert "Bob" Smith',
+    are dropped too.
+    "Last, First Middle" order is recognized by the comma. If nothing but
+    titles follows the comma, as in "Smith," the name is only a surname.
+    Leading initials are skipped when looking for the given name, so
+    "J. Robert Smith" has given name "robert" and middle names ("j",).
+    A single token is treated as a given name with no surname,
+    unless it followed a title, as in "Mr. Smith", when it is the surname.
+    Returns None if there is no name left after removing titles and suffixes.
+
+    >>> parse_full_name("Dr. Robert J. Smith Jr.")
+    ParsedName(given='robert', middle=('j',), surname='smith')
+    >>> parse_full_name("SMITH, BOB")
+    ParsedName(given='bob', middle=(), surname='smith')
+    >>> parse_full_name("Robert Smith, Jr.")
+    ParsedName(given='robert', middle=(), surname='smith')
+    >>> parse_full_name("Madonna")
+    ParsedName(given='madonna', middle=(), surname='')
+    >>> parse_full_name("Mr. Smith")
+    ParsedName(given='', middle=(), surname='smith')
+    >>> parse_full_name("Mr.") is None
+    True
+    """
+    name = name.lower()
+    if not _QUOTE_OPENERS.isdisjoint(name):
+        name = _drop_quoted(name)
+    head, comma, tail = name.translate(_TRANSLATION_TABLE).partition(",")
+    head_tokens, head_titled = _strip_titles(head.split())
+    head_tokens = _undot(head_tokens)
+    if not comma:
+        return _from_given_order(_strip_suffixes(head_tokens, 2), head_titled)
+
+    # "Smith, Bob" is Last, First, but "Bob Smith, Jr." is not.
+    # Segments of only suffixes, like the "Jr." in "Smith, Jr., Bob", are dropped.
+    # A numeral like "V" is only a suffix in its own segment after the given
+    # name, as in "Smith, Bob, V", since "Smith, V" is more likely an initial.
+    titled = False
+    had_suffix = False
+    tail_tokens: list[str] = []
+    for i, segment in enumerate(tail.split(",")):
+        tokens = segment.split()
+        if i == 0:
+            tokens, titled = _strip_titles(tokens)
+        tokens = _undot(tokens)
+        if tokens and not _strip_suffixes(tokens, 0 if i else None):
+            had_suffix = True
+            continue
+        tail_tokens.extend(tokens)
+    tail_tokens = _strip_suffixes(tail_tokens, None)
+
+    surname_tokens = _strip_suffixes(head_tokens, 1)
+    if not tail_tokens:
+        if had_suffix and not titled:
+            return _from_given_order(_strip_suffixes(head_tokens, 2), head_titled)
+        if not surname_tokens:
+            return None
+        return ParsedName(given="", middle=(), surname=" ".join(surname_tokens))
+    if not surname_tokens:
+        return _from_given_order(tail_tokens, titled)
+    given, middle = _split_given(tail_tokens)
+    return ParsedName(given=given, middle=middle, surname=" ".join(surname_tokens))
+
+
+def _from_given_order(tokens: list[str], titled: bool) -> ParsedName | None:
+    if not tokens:
+        return None
+    if len(tokens) == 1:
+        if titled:
+            # "Mr. Smith" is a surname, not a given name.
+            return ParsedName(given="", middle=(), surname=tokens[0])
+        return ParsedName(given=tokens[0], middle=(), surname="")
+    given, middle = _split_given(tokens[:-1])
+    return ParsedName(given=given, middle=middle, surname=tokens[-1])
+
+
+def _split_given(tokens: list[str]) -> tuple[str, tuple[str, ...]]:
+    """Split given-name tokens into the given name and the middle names.
+
+    Leading initials, as in "J. Robert" or "J.R. Robert", are moved into the
+    middle names. If every token is an initial, the first is the given name.
+    """
+    for i, token in enumerate(tokens):
+        if len(token) > 1:
+            return token, (*tokens[:i], *tokens[i + 1 :])
+    return tokens[0], tuple(tokens[1:])
+
+
+def _strip_titles(tokens: list[str]) -> tuple[list[str], bool]:
+    """Remove leading titles. Also returns whether any titles were removed."""
+    start = 0
+    while start < len(tokens) and tokens[start] in TITLES:
+        start += 1
+    return tokens[start:], start > 0
+
+
+def _strip_suffixes(tokens: list[str], numeral_after: int | None) -> list[str]:
+    """Remove trailing suffixes.
+
+    Numerals like "v" are only removed if at least `numeral_after` tokens
+    come before them, and never if `numeral_after` is None.
+    """
+    end = len(tokens)
+    while end > 0:
+        last = tokens[end - 1]
+        if last in SUFFIXES:
+            end -= 1
+        elif (
+            numeral_after is not None
+            and end - 1 >= numeral_after
+            and last in _NUMERAL_SUFFIXES
+        ):
+            end -= 1
+        elif tuple(tokens[end - 2 : end]) in _SPLIT_SUFFIXES:
+            end -= 2
+        elif tuple(tokens[end - 3 : end]) in _SPLIT_SUFFIXES:
+            end -= 3
+        else:
+            break
+    return tokens[:end]
+
+
+def _undot(tokens: list[str]) -> list[str]:
+    """Remove the periods left on tokens by the translation table."""
+    return [t for t in (t.rstrip(".") for t in tokens) if t]
+
+
+def _drop_quoted(name: str) -> str:
+    for opener, closer in _QUOTE_PAIRS.items():
+        start = name.find(opener)
+        while start != -1:
+            end = name.find(closer, start + 1)
+            if end == -1:
+                break
+            name = name[:start] + " " + name[end + 1 :]
+            start = name.find(opener, start)
+    return name
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Set
+from typing import Dict, Iterable, Iterator, Set
 
 from nicknames._csvfile import NameTriplet, name_triplets
+from nicknames._fullname import ParsedName, parse_full_name
 
 _LookupTable = Dict[str, Set[str]]
 
@@ -79,6 +80,57 @@ class NickNamer:
         """
         return self._get(name, self._canonical_lookup)
 
+    def full_name_variants(self, name: str) -> set[str]:
+        """Returns a set of variants of a full name, swapping the given name.
+
+        The full name is parsed with `parse_full_name()`, so titles and suffixes
+        are dropped and "Last, First" order is understood. The given name is
+        then replaced with each of its nicknames and canonical names.
+
+        Results are always lowercase, in "given middle surname" order,
+        and do not include the name itself.
+
+        >>> nn = NickNamer()
+        >>> variants = nn.full_name_variants("Dr. Robert J. Smith Jr.")
+        >>> assert {"bob j smith", "rob j smith"}.issubset(variants)
+        >>> assert "robert j smith" not in variants
+        >>> assert "robert smith" in nn.full_name_variants("SMITH, BOB")
+        >>> assert nn.full_name_variants("Zzyzx Smith") == set()
+        >>> assert nn.full_name_variants("") == set()
+        """
+        parsed = parse_full_name(name)
+        if parsed is None:
+            return set()
+        return self._full_name_variants(parsed)
+
+    def iter_full_name_variants(self, names: Iterable[str]) -> Iterator[set[str]]:
+        """Lazily yields `full_name_variants()` for each name, in order.
+
+        Use this to stream over large inputs without holding them in memory.
+
+        >>> nn = NickNamer()
+        >>> names = iter(["Bob Smith", "SMITH, ROBERT", "Mr."])
+        >>> bob, robert, empty = nn.iter_full_name_variants(names)
+        >>> assert "robert smith" in bob
+        >>> assert "bob smith" in robert
+        >>> assert empty == set()
+        """
+        for name in names:
+            yield self.full_name_variants(name)
+
+    def _full_name_variants(self, parsed: ParsedName) -> set[str]:
+        # parse_full_name() already lowercases and strips, but a subclass
+        # may normalize differently, and its lookup keys are normalized that way.
+        given = self._normalize_name(parsed.given)
+        nicknames = self._nickname_lookup.get(given, ())
+        canonicals = self._canonical_lookup.get(given, ())
+        if not nicknames and not canonicals:
+            return set()
+        rest = " ".join(p for p in (*parsed.middle, parsed.surname) if p)
+        if not rest:
+            return {*nicknames, *canonicals}
+        return {f"{alt} {rest}" for alt in (*nicknames, *canonicals)}
+
     @classmethod
     def from_triplets(cls, lines: Iterable[NameTriplet]) -> NickNamer:
         """Load from an iterable of RDF triple lines.
@@ -125,3 +125,95 @@ def test_default_lookup_copied():
     lookup.clear()
     lookup2 = NickNamer.default_lookup()
     assert lookup2 == lookup_original
+
+
+@pytest.mark.parametrize(
+    "full_name, expected",
+    [
+        ("Dr. Robert J. Smith Jr.", ("robert", ("j",), "smith")),
+        ("SMITH, BOB", ("bob", (), "smith")),
+        ("Smith Jr., Robert J.", ("robert", ("j",), "smith")),
+        ("Robert Smith, Jr.", ("robert", (), "smith")),
+        ("Smith, Jr., Robert", ("robert", (), "smith")),
+        ("Smith, Robert, Jr.", ("robert", (), "smith")),
+        ("J. Robert Smith", ("robert", ("j",), "smith")),
+        ("Smith, J. Robert", ("robert", ("j",), "smith")),
+        ("J. Smith", ("j", (), "smith")),
+        ("Mr. Smith", ("", (), "smith")),
+        ("Gen. Smith", ("", (), "smith")),
+        ("Gen Smith", ("gen", (), "smith")),
+        ("Smith,", ("", (), "smith")),
+        ("Smith, Mr.", ("", (), "smith")),
+        ("J.R. Smith", ("j", ("r",), "smith")),
+        ("Smith, J.R.", ("j", ("r",), "smith")),
+        ("Smith, J.R. Robert", ("robert", ("j", "r"), "smith")),
+        ("Dr.Robert Smith", ("robert", (), "smith")),
+        ("J.R.R. Tolkien", ("j", ("r", "r"), "tolkien")),
+        ("Robert Smith M.D.", ("robert", (), "smith")),
+        ("Robert E. Lee V", ("robert", ("e",), "lee")),
+        ("Robert Smith I", ("robert", (), "smith")),
+        ("Smith, Robert, V", ("robert", (), "smith")),
+        ("Smith, Robert V", ("robert", ("v",), "smith")),
+        ("Robert V", ("robert", (), "v")),
+        ("Robert \u201cBob\u201d Smith", ("robert", (), "smith")),
+        ("Robert (Bob) Smith", ("robert", (), "smith")),
+        ('Robert "Bob" Smith', ("robert", (), "smith")),
+        ("Mary O\u2019Brien", ("mary", (), "o'brien")),
+        ("Smith\uff0c Bob", ("bob", (), "smith")),
+        ("Robert Smith, Ph.D.", ("robert", (), "smith")),
+        ("  mary-jane   o'brien ", ("mary-jane", (), "o'brien")),
+        ("Alexander", ("alexander", (), "")),
+        (", Alexander", ("alexander", (), "")),
+        ("Mrs. Jr.", None),
+        ("", None),
+    ],
+)
+def test_parse_full_name(full_name, expected):
+    assert nicknames.parse_full_name(full_name) == expected
+
+
+def test_full_name_variants(nicknamer: NickNamer):
+    assert nicknamer.full_name_variants("Alexa Smith") == {"alex smith", "al smith"}
+    assert nicknamer.full_name_variants("SMITH, AL") == {
+        "alex smith",
+        "alexa smith",
+        "alexander smith",
+    }
+    assert nicknamer.full_name_variants("Mr. Alex Q. Smith III") == {
+        "al q smith",
+        "alexa q smith",
+        "alexander q smith",
+    }
+    assert nicknamer.full_name_variants("alexa") == {"alex", "al"}
+    assert nicknamer.full_name_variants("not_present smith") == set()
+    assert nicknamer.full_name_variants("Dr.") == set()
+    assert nicknamer.full_name_variants("Mr. Alexa") == set()
+    assert nicknamer.full_name_variants("Alexa,") == set()
+    assert nicknamer.full_name_variants("Alexa (Al) Smith") == {
+        "alex smith",
+        "al smith",
+    }
+    assert nicknamer.full_name_variants("Smith, Jr., Al") == {
+        "alex smith",
+        "alexa smith",
+        "alexander smith",
+    }
+    assert nicknamer.full_name_variants("Q. Alexa Smith") == {
+        "alex q smith",
+        "al q smith",
+    }
+
+
+def test_iter_full_name_variants(nicknamer: NickNamer):
+    names = ["Alexa Smith", "Dr.", "not_present smith", "SMITH, AL"]
+    result = nicknamer.iter_full_name_variants(iter(names))
+    assert list(result) == [nicknamer.full_name_variants(n) for n in names]
+
+    def names_then_error():
+        yield "Alexa Smith"
+        raise RuntimeError("consumed too far")
+
+    result = nicknamer.iter_full_name_variants(names_then_error())
+    assert next(result) == {"alex smith", "al smith"}
+    with pytest.raises(RuntimeError):
+        next(result)